@@ -0,0 +1,56 @@
+'''
+Throughput benchmark of Bin2CSV comparing the memory-mapped bulk conversion against the
+original row by row loop, for both CSV formats.
+
+Usage: python benchmarks/bench_bin2csv.py [rows]
+'''
+import os
+import sys
+import struct
+import tempfile
+import time
+
+from martepy.functions.bin2csv import Bin2CSV
+
+SIGNALS = [(2052, 'Counter', 1, 'I'), (2052, 'Time', 1, 'I'), (2056, 'Error', 1, 'f'),
+           (4104, 'Position', 3, 'd'), (516, 'Flags', 8, 'B')]
+
+def writeBinary(path, rows):
+    ''' Write a FileWriter style binary log with the given number of rows '''
+    row_format = '<' + ''.join(f'{elements}{fmt}' for _, _, elements, fmt in SIGNALS)
+    packer = struct.Struct(row_format)
+    with open(path, 'wb') as fout:
+        fout.write(struct.pack('<I', len(SIGNALS)))
+        for code, name, elements, _ in SIGNALS:
+            fout.write(struct.pack('<H32sI', code, name.encode('utf-8'), elements))
+        for i in range(rows):
+            fout.write(packer.pack(i, i * 1000, i * 0.01, i / 3, i / 7, i / 11,
+                                   *((i + j) % 256 for j in range(8))))
+
+def timeConversion(bin_path, csv_path, **kwargs):
+    ''' Time a single conversion in seconds '''
+    start = time.perf_counter()
+    Bin2CSV(bin_path, csv_path, **kwargs).main()
+    return time.perf_counter() - start
+
+def main(rows=200000):
+    ''' Run the benchmark '''
+    with tempfile.TemporaryDirectory() as directory:
+        bin_path = os.path.join(directory, 'log.bin')
+        writeBinary(bin_path, rows)
+        size_mb = os.path.getsize(bin_path) / 1e6
+        print(f'{rows} rows, {size_mb:.1f} MB binary')
+        for marte2_csv in (True, False):
+            row_csv = os.path.join(directory, 'rows.csv')
+            bulk_csv = os.path.join(directory, 'bulk.csv')
+            row_time = timeConversion(bin_path, row_csv, marte2_csv=marte2_csv, bulk=False)
+            bulk_time = timeConversion(bin_path, bulk_csv, marte2_csv=marte2_csv)
+            with open(row_csv, 'rb') as row_file, open(bulk_csv, 'rb') as bulk_file:
+                identical = row_file.read() == bulk_file.read()
+            print(f'marte2_csv={marte2_csv}: rows {row_time:.2f}s '
+                  f'({size_mb / row_time:.1f} MB/s), bulk {bulk_time:.2f}s '
+                  f'({size_mb / bulk_time:.1f} MB/s), speed-up {row_time / bulk_time:.1f}x, '
+                  f'identical output: {identical}')
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
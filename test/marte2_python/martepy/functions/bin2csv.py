@@ -3,12 +3,15 @@ This module provides capability for a user to convert a MARTe2 written binary fi
 readable CSV file.
 '''
 
+import os
 import struct
-from typing import Type, Tuple, Iterable
+from typing import Type, Tuple, Iterable, List
 from functools import lru_cache
 import itertools
 from dataclasses import dataclass
 
+import numpy as np
+
 
 class Bin2CSVError(Exception):
     """Generic exception for all errors"""
@@ -34,6 +37,13 @@ class SignalDescriptor:
             return self.type_descr.struct_format
         return f'{self.elements:d}{self.type_descr.struct_format}'
 
+    def dtypeField(self, byte_order: str = '<') -> tuple:
+        ''' Return the numpy structured dtype field describing this signal '''
+        dtype = np.dtype(self.type_descr.name).newbyteorder(byte_order)
+        if self.elements == 1:
+            return (self.name, dtype)
+        return (self.name, dtype, (self.elements,))
+
 standard_type_descriptors = {
     t.code: t for t in (
         TypeDescriptor(2048, 'int32', 'i', 4),
@@ -82,6 +92,19 @@ class RowInterpreter:
         return self._struct_endianity_char + ''.join(signal.format() for
                                                      signal in self._signal_descriptors)
 
+    @lru_cache(maxsize=None) # pylint: disable=W1518
+    def rowDtype(self) -> np.dtype:
+        """Return the numpy structured dtype equivalent of rowFormat, with one
+        field per signal, used to interpret many rows at once.
+        """
+        byte_order = {'!': '>', '@': '='}.get(self._struct_endianity_char,
+                                             self._struct_endianity_char)
+        try:
+            return np.dtype([signal.dtypeField(byte_order) for
+                             signal in self._signal_descriptors])
+        except ValueError as e:
+            raise Bin2CSVError(f'Signals cannot be interpreted as a row: {str(e)}') from e
+
     def headerRow(self) -> str:
         """Return the first row of an equivalent CSV file format, containing
         column names.
@@ -123,6 +146,27 @@ class RowInterpreter:
                 csv_value_strings.append(f'{{{inner_values}}}')
         return self._delimeter.join(csv_value_strings) + '\n'
 
+    def rowsToCsv(self, rows: np.ndarray) -> str:
+        """Return the CSV file formatted data for a block of rows, given as an
+        array of the rowDtype. The text is identical to calling binToCsvRow on
+        each row in turn but the values are converted a column at a time.
+        """
+        if len(rows) == 0:
+            return ''
+        return '\n'.join(map(self._delimeter.join, zip(*self._csvColumns(rows)))) + '\n'
+
+    def _csvColumns(self, rows: np.ndarray) -> List[List[str]]:
+        """Return the CSV cell strings for a block of rows, one list per column."""
+        columns = []
+        for signal in self._signal_descriptors:
+            # tolist gives the same Python ints and floats that struct.unpack does
+            values = rows[signal.name].tolist()
+            if signal.elements == 1:
+                columns.append(list(map(str, values)))
+            else:
+                columns.append([f"{{{' '.join(map(str, value))}}}" for value in values])
+        return columns
+
 
 class StandardCSVRowInterpreter(RowInterpreter):
     """A variant of the `RowInterpreter` class which writes a more standardised
@@ -138,6 +182,17 @@ class StandardCSVRowInterpreter(RowInterpreter):
     def valuesToCsvRow(self, row_values: Iterable) -> str:
         return self._delimeter.join(str(value) for value in row_values) + '\n'
 
+    def _csvColumns(self, rows: np.ndarray) -> List[List[str]]:
+        columns = []
+        for signal in self._signal_descriptors:
+            values = rows[signal.name]
+            if signal.elements == 1:
+                columns.append(list(map(str, values.tolist())))
+            else:
+                columns.extend(list(map(str, values[:, index].tolist())) for
+                               index in range(signal.elements))
+        return columns
+
     def headerRow(self) -> str:
         signal_names_string = self._delimeter.join(self._headerItem(signal) for
                                                    signal in self._signal_descriptors)
@@ -157,15 +212,21 @@ class Bin2CSV():
     The main entrypoint to convert a MARTe2 binary log produced by the FileWriter datasource
     to a csv file.
     See RowInterpretator and StandardRowInterpretator for explanation of marte2_csv
+    By default the body of the file is memory-mapped and converted in blocks of chunk_rows
+    rows, set bulk to False to convert it one row at a time instead.
     '''
     def __init__(self,
         bin_path: str = 'log.bin',
         csv_path: str = 'log_0.csv',
-        marte2_csv: bool = True
+        marte2_csv: bool = True,
+        bulk: bool = True,
+        chunk_rows: int = 65536
     ):
         self.bin_path = bin_path
         self.csv_path = csv_path
         self.marte2_csv = marte2_csv
+        self.bulk = bulk
+        self.chunk_rows = chunk_rows
 
     def interpreterClass(self) -> Type[RowInterpreter]:
         ''' Get our declared interpretator'''
@@ -173,42 +234,75 @@ class Bin2CSV():
             return RowInterpreter
         return StandardCSVRowInterpreter
 
-    @lru_cache(maxsize=None) # pylint: disable=W1518
     def unpackStruct(self, name_size, fin):
         ''' Unpack the signal '''
         return struct.unpack('<H' + str(name_size) + 'sI', fin.read((name_size+6)))
 
+    def readDescriptors(self, fin) -> List[SignalDescriptor]:
+        ''' Read the signal descriptors from the header at the start of an open binary file '''
+        nsignals, = struct.unpack('<I', fin.read(4))
+
+        name_size = 32
+
+        signals = []
+        for _ in range(nsignals):
+            signal_code, signal_name, signal_elements = self.unpackStruct(name_size, fin)
+
+            signal_name = signal_name.rstrip(b'\x00').decode('utf-8')
+            try:
+                signal_type = standard_type_descriptors[signal_code]
+            except KeyError:
+                msg = f'Unknown TypeDescription code: {signal_code} for signal {signal_name}'
+                raise Bin2CSVError(msg) # pylint: disable=W0707
+
+            signals.append(SignalDescriptor(signal_name, signal_type, signal_elements))
+        return signals
+
+    def mapRows(self, interpreter: RowInterpreter, header_size: int) -> np.ndarray:
+        '''
+        Memory-map every complete row of the body of the binary file as an array of the
+        interpreter's rowDtype. A trailing partial row is not included.
+        '''
+        body_size = os.path.getsize(self.bin_path) - header_size
+        nrows = body_size // interpreter.rowSize()
+        if nrows == 0:
+            return np.zeros(0, dtype=interpreter.rowDtype())
+        return np.memmap(self.bin_path, dtype=interpreter.rowDtype(), mode='r',
+                         offset=header_size, shape=(nrows,))
+
     def main(self):
         """Convert the binary file into CSV"""
         with open(self.bin_path, 'rb') as fin:
-            nsignals, = struct.unpack('<I', fin.read(4))
-
-            name_size = 32
-
-            signals = []
-            for _ in range(nsignals):
-                signal_code, signal_name, signal_elements = self.unpackStruct(name_size, fin)
-
-                signal_name = signal_name.rstrip(b'\x00').decode('utf-8')
-                try:
-                    signal_type = standard_type_descriptors[signal_code]
-                except KeyError:
-                    msg = f'Unknown TypeDescription code: {signal_code} for signal {signal_name}'
-                    raise Bin2CSVError(msg) # pylint: disable=W0707
-
-                signals.append(SignalDescriptor(signal_name, signal_type, signal_elements))
+            signals = self.readDescriptors(fin)
 
             interpreter = self.interpreterClass()(*signals)
 
             with open(self.csv_path, 'w', encoding='utf-8') as fout:
                 fout.write(interpreter.headerRow())
 
-                while True:
-                    raw_row = fin.read(interpreter.rowSize())
-                    if len(raw_row) < interpreter.rowSize():
-                        if raw_row:
-                            msg = f'Reached EOF with partial row: {len(raw_row)} leftover bytes'
-                            raise Bin2CSVError(msg)
-                        break
-
-                    fout.write(interpreter.binToCsvRow(raw_row))
+                if self.bulk:
+                    self._convertBlocks(interpreter, fin.tell(), fout)
+                else:
+                    self._convertRows(interpreter, fin, fout)
+
+    def _convertBlocks(self, interpreter: RowInterpreter, header_size: int, fout):
+        ''' Convert the memory-mapped body of the file chunk_rows rows at a time '''
+        rows = self.mapRows(interpreter, header_size)
+        for start in range(0, len(rows), self.chunk_rows):
+            fout.write(interpreter.rowsToCsv(rows[start:start + self.chunk_rows]))
+        leftover = os.path.getsize(self.bin_path) - header_size - rows.nbytes
+        if leftover:
+            msg = f'Reached EOF with partial row: {leftover} leftover bytes'
+            raise Bin2CSVError(msg)
+
+    def _convertRows(self, interpreter: RowInterpreter, fin, fout):
+        ''' Convert the body of the file one row at a time '''
+        while True:
+            raw_row = fin.read(interpreter.rowSize())
+            if len(raw_row) < interpreter.rowSize():
+                if raw_row:
+                    msg = f'Reached EOF with partial row: {len(raw_row)} leftover bytes'
+                    raise Bin2CSVError(msg)
+                break
+
+            fout.write(interpreter.binToCsvRow(raw_row))
@@ -1,6 +1,7 @@
 import pytest
 import os
 import csv
+import struct
 
 from martepy.functions.bin2csv import Bin2CSV, Bin2CSVError
 
@@ -31,7 +32,37 @@ def test_bin2csv():
         output_path = os.path.join(os.path.abspath(os.path.dirname(__file__)),'log2.csv')
         binmain = Bin2CSV(input_path,output_path, marte2_csv=False)
         binmain.main()
-    assert str(excinfo.value) == 'Reached EOF with partial row: 4 leftover bytes'
+    assert str(excinfo.value) == 'Reached EOF with partial row: 12 leftover bytes'
     # clean up
     os.remove(os.path.join(os.path.abspath(os.path.dirname(__file__)),'log0.csv'))
-    os.remove(os.path.join(os.path.abspath(os.path.dirname(__file__)),'log1.csv'))
\ No newline at end of file
+    os.remove(os.path.join(os.path.abspath(os.path.dirname(__file__)),'log1.csv'))
+def write_binary(path, signals, rows):
+    ''' Write a FileWriter style binary of (code, name, elements, format) signals '''
+    with open(path, 'wb') as fout:
+        fout.write(struct.pack('<I', len(signals)))
+        for code, name, elements, _ in signals:
+            fout.write(struct.pack('<H32sI', code, name.encode('utf-8'), elements))
+        row_format = '<' + ''.join(f'{elements}{fmt}' for _, _, elements, fmt in signals)
+        for row in rows:
+            fout.write(struct.pack(row_format, *row))
+
+@pytest.mark.parametrize('marte2_csv', [True, False])
+def test_bin2csv_bulk_matches_rows(tmp_path, marte2_csv):
+    signals = [(2052, 'Time', 1, 'I'), (2056, 'Gain', 1, 'f'),
+               (4104, 'Vec', 3, 'd'), (4100, 'Big', 1, 'Q'), (512, 'Small', 2, 'b')]
+    rows = [(i, i * 0.1, i / 3, -1e-7, 1e20, 2**63 + i, -i % 128, 5) for i in range(1000)]
+    input_path = str(tmp_path / 'log.bin')
+    write_binary(input_path, signals, rows)
+
+    Bin2CSV(input_path, str(tmp_path / 'rows.csv'), marte2_csv, bulk=False).main()
+    Bin2CSV(input_path, str(tmp_path / 'bulk.csv'), marte2_csv, chunk_rows=64).main()
+    assert (tmp_path / 'rows.csv').read_bytes() == (tmp_path / 'bulk.csv').read_bytes()
+
+    with pytest.raises(Bin2CSVError) as excinfo:
+        Bin2CSV(os.path.join(os.path.abspath(os.path.dirname(__file__)),'chopped_line.bin'),
+                str(tmp_path / 'rows.csv'), marte2_csv, bulk=False).main()
+    assert str(excinfo.value) == 'Reached EOF with partial row: 12 leftover bytes'
+    with pytest.raises(Bin2CSVError):
+        Bin2CSV(os.path.join(os.path.abspath(os.path.dirname(__file__)),'chopped_line.bin'),
+                str(tmp_path / 'bulk.csv'), marte2_csv).main()
+    assert (tmp_path / 'rows.csv').read_bytes() == (tmp_path / 'bulk.csv').read_bytes()
@@ -0,0 +1,66 @@
+import os
+
+import numpy as np
+import pytest
+
+from xmarte.qt5.services.data_handler.signal_store import (SignalStore,
+                                                           SignalStoreException,
+                                                           parseHeader)
+
+TEST_FILES_DIR = os.path.join(os.getcwd(), 'test/files/')
+
+
+def test_parse_header():
+    assert parseHeader('#c (uint32)[1]') == ('c', np.dtype(np.uint32), 1)
+    assert parseHeader('Sig (float64)[3]\n') == ('Sig', np.dtype(np.float64), 3)
+    assert parseHeader('plain') == ('plain', np.dtype(np.float64), 1)
+
+
+def test_store_from_csv():
+    store = SignalStore.fromCSV(os.path.join(TEST_FILES_DIR, 'test_data_import.csv'))
+    assert len(store) == 503
+    assert store.names()[:4] == ['c', 'd', 'state', 'DTime']
+    assert store['DTime'].dtype == np.uint32
+    assert store['DTime'][:3].tolist() == [2000, 4000, 6000]
+    assert store['newsignal'].dtype == np.float32
+    assert store['newsignal'].flags['C_CONTIGUOUS']
+
+
+def test_store_array_signals(tmp_path):
+    log = tmp_path / 'log.csv'
+    log.write_text('#Time (uint32)[1],Vec (int16)[3]\n0,{1 2 3}\n1,{ 4 5 6 }\n')
+    store = SignalStore.fromCSV(str(log))
+    assert store['Time'].tolist() == [0, 1]
+    assert store['Vec'].shape == (2, 3)
+    assert store['Vec'].dtype == np.int16
+    assert store['Vec'][1].tolist() == [4, 5, 6]
+
+
+def test_store_empty_and_invalid(tmp_path):
+    log = tmp_path / 'empty.csv'
+    log.write_text('#Time (uint32)[1]\n')
+    assert len(SignalStore.fromCSV(str(log))) == 0
+
+    log = tmp_path / 'bad.csv'
+    log.write_text('#Time (uint32)[1]\nabc\n')
+    with pytest.raises(SignalStoreException):
+        SignalStore.fromCSV(str(log))
+
+
+def test_store_from_binary():
+    log = os.path.join('test', 'marte2_python', 'tests', 'functions', 'output.bin')
+    store = SignalStore.fromBinary(log)
+    assert store.names() == ['Counter', 'Time', 'Signal3']
+    assert len(store) == 128
+    assert store['Counter'][:3].tolist() == [1, 2, 4]
+    assert store['Time'].dtype == np.uint32
+    assert store['Signal3'].shape == (128, 8)
+    assert store['Signal3'][0].tolist() == [1, 2, 3, 4, 5, 6, 7, 8]
+
+    # A partially written final row is ignored
+    chopped = os.path.join('test', 'marte2_python', 'tests', 'functions', 'chopped_line.bin')
+    assert len(SignalStore.fromBinary(chopped)) == 126
+
+    bad = os.path.join('test', 'marte2_python', 'tests', 'functions', 'bad_descriptor.bin')
+    with pytest.raises(SignalStoreException):
+        SignalStore.fromBinary(bad)
@@ -8,7 +8,9 @@ from PyQt5.QtWidgets import QToolBar, QAction
 
 from xmarte.qt5.services.data_handler.graph_window.data.data_node import DataNode
 from xmarte.qt5.services.data_handler.graph_window.plot.plot_node import PlotNode
+from xmarte.qt5.services.data_handler.graph_window.plot.decimation import DecimationPyramid
 from xmarte.qt5.services.data_handler.graph_window.graph_window import GraphWindow
+from xmarte.qt5.services.data_handler.graph_window.pdf_export import PdfExportWorker
 from xmarte.qt5.services.data_handler.widgets.playback_widget import PlayToolbarWidget
 from xmarte.nodeeditor.node_edge import XMARTeEdge
 
@@ -87,6 +89,40 @@ def test_plot_interaction(plot_graph) -> None:
     )
     plot_graph.rightlayout.history[0].mouseReleaseEvent(event)
 
+def test_plot_zoom_resamples(plot_graph) -> None:
+    '''Test zooming redraws the visible range and resetting restores the cached extent.'''
+    chart_view = plot_graph.rightlayout.history[0]
+    series = chart_view.chart().series()[0]
+    assert chart_view.x_extent == (0.0, 502.0)
+    axis = chart_view.chart().axes(Qt.Horizontal)[0]
+    axis.setRange(10, 20)
+    assert [point.x() for point in series.pointsVector()] == [float(x) for x in range(10, 21)]
+    event = QMouseEvent(
+        QMouseEvent.MouseButtonPress,
+        QPoint(50, 50),
+        Qt.RightButton,
+        Qt.RightButton,
+        Qt.NoModifier
+    )
+    chart_view.mouseReleaseEvent(event)
+    assert (axis.min(), axis.max()) == (0.0, 502.0)
+    assert series.pointsVector()[-1].x() == 502.0
+
+def test_decimation_pyramid() -> None:
+    '''Test decimated points keep the extremes of each bucket.'''
+    data = np.sin(np.arange(1000000) / 1000.0)
+    data[123457] = 5.0
+    pyramid = DecimationPyramid(data)
+    x_values, y_values = pyramid.points(pixels=500)
+    assert len(x_values) <= 2 * 1000
+    assert y_values.max() == 5.0
+    assert y_values.min() == data.min()
+    assert np.all(np.diff(x_values) >= 0)
+    x_values, y_values = pyramid.points(100, 199, pixels=500)
+    assert x_values.tolist() == list(range(100, 200))
+    assert y_values.tolist() == data[100:200].tolist()
+    assert DecimationPyramid([]).points()[0].tolist() == []
+
 def test_expand_parameters(plot_graph, qtbot) -> None:
     '''Test expanding a data node parameter section.'''
     data_node = next(node for node in plot_graph.editor.scene.nodes if isinstance(node, DataNode))
@@ -106,9 +142,29 @@ def test_export_graph(plot_graph, monkeypatch, qtbot) -> None:
     def pdf_removed() -> None:
         assert not os.path.exists(path)
     qtbot.waitUntil(pdf_exists)
+    qtbot.waitUntil(lambda: plot_graph.export_thread is None)
     os.remove(path)
     qtbot.waitUntil(pdf_removed)
 
+def test_pdf_export_worker(tmp_path) -> None:
+    '''Test the export worker decimates each page and reports progress.'''
+    path = str(tmp_path / 'plots.pdf')
+    pyramid = DecimationPyramid(np.arange(1000000, dtype=np.float64))
+    worker = PdfExportWorker(path, [('Plot 1', [('a', pyramid)]), ('Plot 2', [])])
+    progress = []
+    worker.progress_update.connect(progress.append)
+    worker.run()
+    assert progress == [50, 100]
+    assert os.path.exists(path)
+    assert not os.path.exists(path + '.part')
+    assert os.path.getsize(path) < 100000
+
+    interrupted = str(tmp_path / 'interrupted.pdf')
+    worker = PdfExportWorker(interrupted, [('Plot 1', [('a', pyramid)])])
+    worker.interrupt()
+    worker.run()
+    assert not os.path.exists(interrupted)
+
 def test_save_load(plot_graph, monkeypatch, qtbot) -> None:
     '''Test saving and loading a plot setup.'''
     saveAction = get_action(plot_graph, label='&Save')
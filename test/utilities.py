@@ -13,6 +13,7 @@ import gc
 from pathlib import Path
 import shutil
 import time
+import numpy as np
 from PyQt5.QtTest import QTest
 from PyQt5.QtCore import QSize, Qt, QModelIndex
 from PyQt5.QtWidgets import QFileDialog, QMessageBox, QLineEdit, QStyle, QApplication
@@ -434,17 +435,17 @@ def import_data(mainwindow, monkeypatch):
     data_menu = next(a for a in mainwindow.menuBar.actions() if a.text() == '&Data Manager')
     import_action = next(a for a in data_menu.menu().actions() if a.text() == '&Import Data')
     import_action.triggered.emit()
-    assert mainwindow.state_scenes['Error']['Thread1'].nodes[0].outputs[0].data == ['0']*503
-    assert mainwindow.state_scenes['State1']['Thread2'].nodes[0].outputs[0].data == ['0']*503
-    assert mainwindow.state_scenes['State1']['Thread2'].nodes[0].outputs[1].data == ['0']*503
+    assert list(mainwindow.state_scenes['Error']['Thread1'].nodes[0].outputs[0].data) == [0]*503
+    assert list(mainwindow.state_scenes['State1']['Thread2'].nodes[0].outputs[0].data) == [0]*503
+    assert list(mainwindow.state_scenes['State1']['Thread2'].nodes[0].outputs[1].data) == [0]*503
     io_gam = next(a for a in mainwindow.state_scenes['State1']['Thread1'].nodes if a.title == 'IO (IOGAM)')
-    assert io_gam.outputs[0].data == ['0']*503
-    assert io_gam.outputs[1].data == ['0']*503
+    assert list(io_gam.outputs[0].data) == [0]*503
+    assert list(io_gam.outputs[1].data) == [0]*503
     constant_gam = next(a for a in mainwindow.state_scenes['State1']['Thread1'].nodes if a.title == 'Constants (ConstantGAM)')
     newsignal = next(a for a in constant_gam.outputs if a.label == 'newsignal')
     newsignal1 = next(a for a in constant_gam.outputs if a.label == 'newsignal1')
-    assert newsignal.data == ['2.000000']*503
-    assert newsignal1.data == ['0.300000']*503
+    assert list(newsignal.data) == [np.float32(2.0)]*503
+    assert list(newsignal1.data) == [np.float32(0.3)]*503
     
 def setup_complex_const(mainwindow, node, delete=True):
     mainwindow.rightpanel.configbarBox.itemAt(5).widget().clicked.emit()
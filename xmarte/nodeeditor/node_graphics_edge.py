@@ -146,7 +146,7 @@ class XMARTeQDMGraphicsEdge(QDMGraphicsEdge):
         if self.edge.scene.playback:
             point = self.path().pointAtPercent(0.5)
             idx = self.edge.scene.count
-            if self.edge.start_socket.data:
+            if self.edge.start_socket.data is not None:
                 try:
                     value = str(self.edge.start_socket.data[idx])
                     self.draw_box_at_point(painter, point, value)
@@ -6,6 +6,7 @@ from xmarte.qt5.libraries.functions import updateDefaultDialogDir
 from xmarte.qt5.services.data_handler.graph_window.graph_window import GraphWindow
 
 from xmarte.qt5.services.service import Service
+from .signal_store import SignalStore, SignalStoreException
 from .widgets.playback_widget import PlayToolbarWidget
 
 class DataException(Exception):
@@ -21,6 +22,7 @@ class DataManager(Service):
         self.playbackToolBar = None
         self.import_data_action = None
         self.clear_data_action = None
+        self.signal_store = None
 
     def loadMenu(self, menu_bar):
         ''' Load our service menu '''
@@ -42,10 +44,14 @@ class DataManager(Service):
 
         options = QFileDialog.Options()
         fileName, _ = QFileDialog.getOpenFileName(None, "Open File", default_dir,
-                                                  "All Files (*);;CSV files (*.csv)",
+                                                  "All Files (*);;CSV files (*.csv);;"
+                                                  "MARTe2 binary files (*.bin)",
                                                   options=options)
         if fileName:
-            self.loadCSVData(fileName)
+            if fileName.endswith('.bin'):
+                self.loadBinaryData(fileName)
+            else:
+                self.loadCSVData(fileName)
             self.application.settings["GeneralPanel"]["file_location"] = os.path.dirname(fileName)
             updateDefaultDialogDir(os.path.dirname(fileName))
 
@@ -65,32 +71,40 @@ class DataManager(Service):
                 for node in thread.nodes:
                     for output in node.outputs:
                         output.data = None
+        self.signal_store = None
         self.playbackToolBar.stopEvent()
         self.playbackToolBar.enableDisable(False)
 
-    def loadCSVData(self, log_file_path): # pylint: disable=R0914
+    def loadCSVData(self, log_file_path):
         ''' Load CSV data from file into our nodes '''
-        D={}
-        lines=open(log_file_path, encoding='utf-8').read().split('\n') # pylint: disable=R1732
-        headers = lines[0].split(',')
-        lines = lines[1:-1]
-        values = [line.split(',') for line in lines]
-        for header,index in zip(headers,range(len(headers))):
-            D[header.replace('\n','').replace('#','')] = index
-        if len(lines) == 0:
+        try:
+            store = SignalStore.fromCSV(log_file_path)
+        except SignalStoreException as e:
+            raise DataException(str(e)) from e
+        self.loadSignalStore(store)
+
+    def loadBinaryData(self, log_file_path):
+        ''' Load a MARTe2 FileWriter binary log from file into our nodes '''
+        try:
+            store = SignalStore.fromBinary(log_file_path)
+        except SignalStoreException as e:
+            raise DataException(str(e)) from e
+        self.loadSignalStore(store)
+
+    def loadSignalStore(self, store):
+        ''' Share the columns of a signal store with the node outputs they were logged from '''
+        if len(store) == 0:
             raise DataException('''No output data was recorded, it is possible your configuration
  is unrunnable, you should check it locally or contact the support team.''')
-        headers_simple = {key.split(' ')[0]: value for key, value in D.items()}
+        self.signal_store = store
         for _, state in self.application.state_scenes.items():
             for _, thread in state.items():
                 for node in thread.nodes:
                     for output in node.outputs:
-                        if output.label in headers_simple:
-                            # We have data for this output, get it's index
-                            output_name = headers_simple[output.label]
-                            output.data = [row[output_name] for row in values]
-                            # Now load our data into our socket
+                        if output.label in store:
+                            # Sockets reference the store's column rather than copy it
+                            output.data = store[output.label]
         self.playbackToolBar.enableDisable(True)
         # Figure out maxcount
-        self.playbackToolBar.counter_thread.maxcount = len(values) - 1
-        self.playbackToolBar.aftlbl.setText(str(len(values) - 1))
+        self.playbackToolBar.counter_thread.maxcount = len(store) - 1
+        self.playbackToolBar.aftlbl.setText(str(len(store) - 1))
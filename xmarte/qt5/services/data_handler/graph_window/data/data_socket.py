@@ -2,6 +2,8 @@
 serializable and deserializable for simplifying saving and loading '''
 from collections import OrderedDict
 
+import numpy as np
+
 from nodeeditor.node_socket import LEFT_TOP
 
 from xmarte.nodeeditor.node_socket import XMARTeLabeledSocket
@@ -19,7 +21,10 @@ class DataSocket(XMARTeLabeledSocket):
     def serialize(self) -> OrderedDict:
         ''' Serialize our socket along with the data '''
         res = super().serialize()
-        res['data'] = self.data
+        if isinstance(self.data, np.ndarray):
+            res['data'] = self.data.tolist()
+        else:
+            res['data'] = self.data
         return res
 
     def deserialize(self, data: dict, hashmap: dict={}, # pylint:disable=W1113
@@ -2,10 +2,7 @@
 
 import os
 
-from matplotlib import pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
-
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread
 from PyQt5.QtChart import QChart, QChartView
 from PyQt5.QtWidgets import (QMainWindow,
                              QWidget,
@@ -14,6 +11,8 @@ from PyQt5.QtWidgets import (QMainWindow,
                              QAction,
                              QFileDialog,
                              QHBoxLayout,
+                             QMessageBox,
+                             QProgressDialog,
                              QVBoxLayout,
                              QSizePolicy,
                              QSplitter)
@@ -21,6 +20,7 @@ from PyQt5.QtWidgets import (QMainWindow,
 from xmarte.qt5.services.data_handler.graph_window.plot.plot_node import PlotNode
 from xmarte.qt5.services.data_handler.graph_window.plot.plot_chart import PlotChart
 from xmarte.qt5.services.data_handler.graph_window.node_picker import NodePicker
+from xmarte.qt5.services.data_handler.graph_window.pdf_export import PdfExportWorker
 from xmarte.qt5.services.data_handler.graph_window.graph.graph_scene import GraphEditorWidget
 from xmarte.qt5.libraries.functions import deepcopyWithoutAttribute, updateDefaultDialogDir
 
@@ -34,6 +34,9 @@ class GraphWindow(QMainWindow):
         self.parent_plugin = parent_plugin
         self.application.newwindow = self
         self.scenes = deepcopyWithoutAttribute(self.application.state_scenes, 'application')
+        self.export_thread = None
+        self.export_worker = None
+        self.export_progress = None
         self.screen = self.application.app.primaryScreen()
         self.size = self.screen.size()
         self.setGeometry(
@@ -70,34 +73,53 @@ class GraphWindow(QMainWindow):
     def export(self):
         ''' Export our data set to file '''
         filename = QFileDialog.getSaveFileName(self, "Save Diagram", "", "pdf (*.pdf)")
-        if filename[0]:
-            if not (filename := filename[0]).endswith('.pdf'):
-                filename += '.pdf'
-            # Create a PdfPages object to save the plots
-            with PdfPages(filename) as pdf:
-                # Create and save multiple plots
-                for i in self.rightlayout.history:  # Create 5 plots for demonstration
-                    # Create some sample data for each plot
-                    plt.figure(figsize=(6, 4))
-                    for serial in i.chart().series():
-                        x = [a.x() for a in serial.pointsVector()]
-                        y = [a.y() for a in serial.pointsVector()]
-                        plt.plot(x, y)
-
-                    plt.xlabel('X-axis')
-                    plt.ylabel('Y-axis')
-                    plt.title(i.chart().title())  # Add title for each plot
-
-                    # Save the plot to the PDF
-                    pdf.savefig()
-
-                    # Close the plot to release memory (optional)
-                    plt.close()
+        if not filename[0] or self.export_thread is not None:
+            return
+        if not (filename := filename[0]).endswith('.pdf'):
+            filename += '.pdf'
+        # Pages are read from the signal arrays behind each chart rather than its Qt series
+        pages = [(chart_view.chart().title(),
+                  [(label, pyramid) for label, pyramid, _ in chart_view.signals])
+                 for chart_view in self.rightlayout.history]
+
+        self.export_progress = QProgressDialog("Exporting plots...", "Cancel", 0, 100, self)
+        self.export_progress.setWindowTitle("Export as PDF")
+        self.export_progress.setMinimumDuration(500)
+        self.export_worker = PdfExportWorker(filename, pages)
+        self.export_thread = QThread()
+        self.export_worker.moveToThread(self.export_thread)
+        self.export_worker.progress_update.connect(self.export_progress.setValue)
+        self.export_worker.export_error.connect(self.exportError)
+        self.export_worker.finished.connect(self.exportFinished)
+        # Direct so the request reaches the worker while its thread is busy rendering
+        self.export_progress.canceled.connect(self.export_worker.interrupt, Qt.DirectConnection)
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_thread.start()
+
+    def exportFinished(self):
+        ''' Handles the export thread completion signal '''
+        self.export_thread.quit()
+        self.export_thread.wait()
+        self.export_thread = None
+        self.export_worker = None
+        self.export_progress.reset()
+
+    def exportError(self, message):
+        ''' Show an export error to the user '''
+        QMessageBox.warning(self, "Export as PDF", message)
 
     def exit(self):
         ''' Close Window '''
         self.close()
 
+    def closeEvent(self, event):
+        ''' Stop any export in progress before the window goes '''
+        if self.export_thread is not None:
+            self.export_worker.interrupt()
+            self.export_thread.quit()
+            self.export_thread.wait()
+        super().closeEvent(event)
+
     def save(self):
         ''' Save our scene plots to file '''
         default_dir = ""
@@ -2,6 +2,8 @@
 import copy
 from functools import partial
 
+import numpy as np
+
 from PyQt5 import QtGui
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (QWidget,
@@ -195,7 +197,7 @@ class NodePicker(QWidget):
         for a in node.outputs:
             if hasattr(a, 'data'):
                 if a.data is not None:
-                    if isinstance(a.data, list):
+                    if isinstance(a.data, (list, np.ndarray)):
                         if len(a.data) == 0:
                             a.data = None
                     else:
@@ -0,0 +1,60 @@
+''' The worker which exports the graph window plots to a PDF '''
+import os
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import FigureCanvasPdf, PdfPages
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class PdfExportWorker(QObject):
+    '''
+    Render plots to a multi page PDF away from the GUI thread. Each page is given as a
+    title and a list of (label, DecimationPyramid) signals, the signals are decimated to
+    the resolution of the page so the size of the file does not grow with the log.
+    '''
+    progress_update = pyqtSignal(int)
+    finished = pyqtSignal(str)
+    export_error = pyqtSignal(str)
+
+    def __init__(self, filename, pages, figsize=(6, 4), dpi=150):
+        super().__init__()
+        self.filename = filename
+        self.pages = pages
+        self.figsize = figsize
+        self.dpi = dpi
+        self._is_interrupted = False
+
+    def interrupt(self):
+        ''' Stop the export after the page being rendered '''
+        self._is_interrupted = True
+
+    def run(self):
+        ''' Write each page then move the finished file into place '''
+        partial = self.filename + '.part'
+        pixels = int(self.figsize[0] * self.dpi)
+        try:
+            with PdfPages(partial) as pdf:
+                for page_no, (title, signals) in enumerate(self.pages):
+                    if self._is_interrupted:
+                        break
+                    # Figures are made without pyplot, which may only be used on the GUI thread
+                    figure = Figure(figsize=self.figsize, dpi=self.dpi)
+                    FigureCanvasPdf(figure)
+                    axes = figure.add_subplot()
+                    for label, pyramid in signals:
+                        axes.plot(*pyramid.points(pixels=pixels), label=label)
+                    axes.set_xlabel('X-axis')
+                    axes.set_ylabel('Y-axis')
+                    axes.set_title(title)
+                    pdf.savefig(figure)
+                    self.progress_update.emit(int(100 * (page_no + 1) / len(self.pages)))
+            if self._is_interrupted:
+                os.remove(partial)
+            else:
+                os.replace(partial, self.filename)
+        except (OSError, ValueError) as e:
+            if os.path.exists(partial):
+                os.remove(partial)
+            self.export_error.emit(f'Could not export plots to {self.filename}: {str(e)}')
+        self.finished.emit(self.filename)
@@ -0,0 +1,65 @@
+'''
+Level of detail support for plotting long signals.
+
+A signal is reduced once into a pyramid of min/max summaries, each level halving the number
+of points of the one below it. Any visible range of the signal can then be drawn from the
+level whose buckets are about a pixel wide, so the number of points handed to the chart
+depends on the width of the plot rather than the length of the signal.
+'''
+import math
+
+import numpy as np
+
+
+class DecimationPyramid:
+    '''
+    Min/max decimation pyramid of a signal sampled once per cycle, the x value of each
+    sample being its cycle index.
+    '''
+    def __init__(self, data):
+        self.y = np.asarray(data, dtype=np.float64)
+        # Level k holds, for each bucket of 2**k samples, the index of its min and max sample
+        self.levels = []
+        lows = highs = np.arange(len(self.y))
+        while len(lows) > 1:
+            lows = self._reduce(lows, np.less_equal)
+            highs = self._reduce(highs, np.greater_equal)
+            self.levels.append((lows, highs))
+
+    def __len__(self):
+        return len(self.y)
+
+    def _reduce(self, indices, keep_first):
+        ''' Halve a level by picking one index of each neighbouring pair '''
+        if len(indices) % 2:
+            indices = np.append(indices, indices[-1])
+        pairs = indices.reshape(-1, 2)
+        first, second = pairs[:, 0], pairs[:, 1]
+        return np.where(keep_first(self.y[first], self.y[second]), first, second)
+
+    def extent(self):
+        ''' The full x range of the signal '''
+        return 0.0, float(max(len(self.y) - 1, 0))
+
+    def points(self, x_min=None, x_max=None, pixels=1000):
+        '''
+        Return the x and y arrays to draw the signal between x_min and x_max at a width of
+        the given number of pixels. Ranges that fit are returned at full resolution, longer
+        ranges as the min and max of each pixel wide bucket in the order they occur.
+        '''
+        start = 0 if x_min is None else max(int(math.floor(x_min)), 0)
+        stop = len(self.y) if x_max is None else min(int(math.ceil(x_max)) + 1, len(self.y))
+        stop = max(stop, start)
+        pixels = max(int(pixels), 1)
+        count = stop - start
+        if count <= 2 * pixels:
+            indices = np.arange(start, stop)
+        else:
+            level = min(int(math.ceil(math.log2(count / pixels))), len(self.levels))
+            bucket = 2 ** level
+            lows, highs = self.levels[level - 1]
+            first, last = start // bucket, -(-stop // bucket)
+            lows, highs = lows[first:last], highs[first:last]
+            # Keep the ends of the range so the line spans the whole view
+            indices = np.unique(np.concatenate(([start], lows, highs, [stop - 1])))
+        return indices.astype(np.float64), self.y[indices]
@@ -1,7 +1,9 @@
 ''' The chart instance used in graph window for plotting '''
 from PyQt5 import QtGui
-from PyQt5.QtCore import Qt
-from PyQt5.QtChart import QChartView
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtChart import QChartView, QLineSeries
+
+from xmarte.qt5.services.data_handler.graph_window.plot.decimation import DecimationPyramid
 
 def defineAxis(axis):
     '''Defines the axis based on the orientation.'''
@@ -18,21 +20,56 @@ class PlotChart(QChartView):
         self.setMouseTracking(True)
         self.viewport().installEventFilter(self)
         self.setContentsMargins(0,0,0,0)
+        # (label, DecimationPyramid, QLineSeries) for each plotted signal
+        self.signals = []
+        self.x_extent = None
 
     def eventFilter(self, obj, event):
         '''Catch potential events in chart.'''
         return super().eventFilter(obj, event)
 
+    def plotSignals(self, signals):
+        '''
+        Replace the plotted series with the given (label, data) signals, each drawn through
+        a decimation pyramid so only about two points per pixel are given to the chart.
+        '''
+        chart = self.chart()
+        chart.removeAllSeries()
+        self.signals = []
+        self.x_extent = None
+        for label, data in signals:
+            pyramid = DecimationPyramid(data)
+            series = QLineSeries()
+            series.setName(label)
+            self._replacePoints(series, pyramid, *pyramid.extent())
+            chart.addSeries(series)
+            self.signals.append((label, pyramid, series))
+            x_min, x_max = pyramid.extent()
+            if self.x_extent is not None:
+                x_min, x_max = min(x_min, self.x_extent[0]), max(x_max, self.x_extent[1])
+            self.x_extent = (x_min, x_max)
+        chart.createDefaultAxes()
+        for axis in chart.axes(Qt.Horizontal):
+            axis.rangeChanged.connect(self.resample)
+
+    def resample(self, x_min, x_max):
+        '''Redraw each series from its pyramid for the visible x range.'''
+        for _, pyramid, series in self.signals:
+            self._replacePoints(series, pyramid, x_min, x_max)
+
+    def _replacePoints(self, series, pyramid, x_min, x_max):
+        '''Replace the points of a series in one call.'''
+        pixels = max(int(self.chart().plotArea().width()), self.width(), 100)
+        x_values, y_values = pyramid.points(x_min, x_max, pixels)
+        series.replace([QPointF(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())])
+
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent):
         '''All user to control time axis change.'''
         if event.button() == 2:
             chart = self.chart()
             for axis in chart.axes():
-                if axis.orientation() == Qt.Horizontal:
-                    axis.setRange(
-                        min(a.x() for a in chart.series()[0].pointsVector()),
-                        max(a.x() for a in chart.series()[0].pointsVector()),
-                    )
+                if axis.orientation() == Qt.Horizontal and self.x_extent is not None:
+                    axis.setRange(*self.x_extent)
                 defineAxis(axis)
             return None
         return super().mouseReleaseEvent(event)
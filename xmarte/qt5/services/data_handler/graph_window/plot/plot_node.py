@@ -1,6 +1,6 @@
 ''' The plot node which is used to define plot graphs '''
-from PyQt5.QtCore import Qt, QPointF
-from PyQt5.QtChart import QChart, QChartView, QLineSeries
+from PyQt5.QtCore import Qt
+from PyQt5.QtChart import QChart, QChartView
 
 from xmarte.qt5.nodes.node_graphics import NodeContent
 from xmarte.qt5.services.data_handler.graph_window.plot.plot_chart import PlotChart
@@ -78,23 +78,12 @@ class PlotNode(GraphNode):
                     createChart(self)
                     chartno = len(self.charts.history) - 1
             # Get our chart
-            chart = self.chart_list[chartno]
+            chart_view = self.charts.history[chartno]
             # Okay so now we have a chartno we need to wipe our chart and write the data from
             # all sources to it
-            chart.removeAllSeries()
-
-            for edge in socket.edges:
-                data = edge.start_socket.data
-                label = edge.start_socket.label
-                if data is not None:
-                    series = QLineSeries()
-                    series.setName(label)
-                    for x, y in enumerate(data):
-                        series.append(QPointF(float(x), float(y)))
-                    chart.addSeries(series)
-
-            # # Here we need logic to work out our axis
-            chart.createDefaultAxes()
+            chart_view.plotSignals([(edge.start_socket.label, edge.start_socket.data)
+                                    for edge in socket.edges
+                                    if edge.start_socket.data is not None])
         else:
             # Remove the chart and the socket
             # Do not remove socket if socket.label = Plot 1 and no other sockets available
@@ -0,0 +1,120 @@
+'''
+A columnar store of logged signal data.
+
+CSV logs are parsed once into one typed, contiguous NumPy array per column and MARTe2
+FileWriter binary logs are memory-mapped with each column exposed as a view of the file.
+Sockets are then given the column arrays themselves so that playback, plotting and export all
+share the same buffer rather than each holding their own copy of the data.
+'''
+import re
+import struct
+import warnings
+
+import numpy as np
+
+from martepy.functions.bin2csv import Bin2CSV, Bin2CSVError, RowInterpreter
+
+HEADER_PATTERN = re.compile(r'^\s*(?P<name>[^\s(\[]+)\s*(?:\((?P<type>[^)]*)\))?'
+                            r'\s*(?:\[(?P<elements>\d+)\])?\s*$')
+ARRAY_PATTERN = re.compile(r'\{([^}]*)\}')
+
+
+class SignalStoreException(Exception):
+    ''' Raised when a log cannot be interpreted as columns of signal data '''
+
+
+def columnDtype(type_name):
+    ''' Convert a MARTe2 type name as written in a log header to a numpy dtype '''
+    try:
+        return np.dtype(type_name)
+    except TypeError:
+        return np.dtype(np.float64)
+
+
+def parseHeader(header):
+    '''
+    Parse a single column header of the form written by RowInterpreter.headerRow,
+    i.e. "name (type)[elements]", returning the name, dtype and number of elements.
+    Headers without a type or element count default to a float64 scalar.
+    '''
+    header = header.strip().lstrip('#')
+    match = HEADER_PATTERN.match(header)
+    if match is None:
+        return header.split(' ')[0], np.dtype(np.float64), 1
+    type_name = match.group('type') or 'float64'
+    elements = int(match.group('elements') or 1)
+    return match.group('name'), columnDtype(type_name.strip()), elements
+
+
+def _flattenArrays(line):
+    ''' Expand MARTe2 "{a b c}" array cells into plain delimited values '''
+    return ARRAY_PATTERN.sub(lambda match: ','.join(match.group(1).split()), line)
+
+
+class SignalStore:
+    '''
+    Columnar, typed storage of every signal in a log. Scalar signals are held as 1D arrays
+    indexed by cycle and array signals as 2D arrays of shape (cycles, elements).
+    '''
+    def __init__(self, columns=None):
+        self.columns = dict(columns) if columns else {}
+
+    def __len__(self):
+        ''' The number of cycles held in the store '''
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def names(self):
+        ''' Return the signal names in the order they were logged '''
+        return list(self.columns.keys())
+
+    @classmethod
+    def fromCSV(cls, log_file_path, delimiter=','):
+        ''' Parse a MARTe2 CSV log into a new store '''
+        with open(log_file_path, encoding='utf-8') as log_file:
+            header_line = log_file.readline()
+            if not header_line.strip():
+                return cls()
+            headers = [parseHeader(header) for header in header_line.split(delimiter)]
+            fields = [(name, dtype) if elements == 1 else (name, dtype, (elements,))
+                      for name, dtype, elements in headers]
+            lines = (line for line in log_file if line.strip())
+            if any(elements > 1 for _, _, elements in headers):
+                lines = (_flattenArrays(line) for line in lines)
+            try:
+                with warnings.catch_warnings():
+                    # An empty log is reported through the store's length instead
+                    warnings.simplefilter('ignore', UserWarning)
+                    table = np.loadtxt(lines, delimiter=delimiter, dtype=np.dtype(fields),
+                                       comments=None, ndmin=1)
+            except ValueError as e:
+                raise SignalStoreException(
+                    f'Could not read {log_file_path} as signal data: {str(e)}'
+                ) from e
+        return cls((name, np.ascontiguousarray(table[name])) for name, _, _ in headers)
+
+    @classmethod
+    def fromBinary(cls, log_file_path):
+        '''
+        Memory-map a MARTe2 FileWriter binary log into a new store without converting it to
+        text, each column is a read-only view of the file. A trailing partial row, as left by
+        an interrupted run, is ignored.
+        '''
+        converter = Bin2CSV(log_file_path)
+        try:
+            with open(log_file_path, 'rb') as log_file:
+                signals = converter.readDescriptors(log_file)
+                header_size = log_file.tell()
+            rows = converter.mapRows(RowInterpreter(*signals), header_size)
+        except (Bin2CSVError, struct.error) as e:
+            raise SignalStoreException(
+                f'Could not read {log_file_path} as a MARTe2 binary log: {str(e)}'
+            ) from e
+        return cls((signal.name, rows[signal.name]) for signal in signals)
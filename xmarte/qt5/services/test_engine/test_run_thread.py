@@ -149,6 +149,9 @@ check your settings, connection and the runner on the server."""
 
             # Assume done, now write to file
             # Okay open modal window and communicate with it to show stuff.
+            # Log in MARTe2's binary format so the data manager can map the output directly
+            self.sim_app_def.filewriter.fileformat = 'binary'
+            self.sim_app_def.filewriter.filename = 'output.bin'
             config = self.sim_app_def.writeToConfig()
             temp_directory = os.path.join(self.remote_settings['temp_folder'], "temp")
             if not os.path.exists(temp_directory):
@@ -210,9 +213,6 @@ check your settings, connection and the runner on the server."""
                 cmd = f"{prepend}{cmd} -v {volume} -w /root/tests {image} {script} {parameters}"
                 p = subprocess.Popen(cmd.split()) # pylint:disable=R1732
                 p.wait()
-                if os.path.exists(os.path.join(os.path.abspath(temp_directory), 'output.csv')):
-                    shutil.copy(os.path.join(os.path.abspath(temp_directory), 'output.csv'),
-                                os.path.join(os.path.abspath(temp_directory),'log_0.csv'))
                 if self._is_interrupted:
                     return
                 self.text_update.emit("Test Execution completed")
@@ -325,16 +325,15 @@ check your settings, connection and the runner on the server."""
             raise AbortException(e) from e
 
     def collectResults(self, hostname, ftp_port, username, password, temp_directory):
-        ''' Pull the file and put it to temp_directory/log_0.csv '''
+        ''' Pull the binary log to temp_directory/output.bin, falling back to
+        temp_directory/log_0.csv for runners which still convert the log to CSV '''
         try:
             if self._is_interrupted:
                 return
             self.text_update.emit("Reopening FTP Session...")
             # Instead we want to collect all files as we might not know what
             # they will be at this stage.
-            #file_to = os.path.abspath(os.path.join(temp_directory, "log_0.csv"))
             session = ftplib.FTP()
-            file_to = os.path.join(temp_directory, 'log_0.csv')
             session.connect(hostname, ftp_port)
             self.progress_update.emit(72)
             # Output: '220 Server ready for new user.'
@@ -344,14 +343,19 @@ check your settings, connection and the runner on the server."""
             self.text_update.emit("Getting results file...")
             self.progress_update.emit(75)
 
-            with open(file_to, "wb") as file_out:
-                command = f"RETR {self.session_id}/log_0.csv"
-                session.retrbinary(command, file_out.write)
-                file_out.close()  # close file and FTP
-                if self._is_interrupted:
-                    return
-                self.text_update.emit("File Retrieved")
-                self.progress_update.emit(79)
+            for log_name in ('output.bin', 'log_0.csv'):
+                file_to = os.path.join(temp_directory, log_name)
+                try:
+                    with open(file_to, "wb") as file_out:
+                        command = f"RETR {self.session_id}/{log_name}"
+                        session.retrbinary(command, file_out.write)
+                    break
+                except ftplib.error_perm:
+                    os.remove(file_to)
+            if self._is_interrupted:
+                return
+            self.text_update.emit("File Retrieved")
+            self.progress_update.emit(79)
 
             session.quit()
         except (AttributeError,HTTPError) as e:
@@ -75,12 +75,13 @@ class TestProgressWindow(QMainWindow):
     def startThread(self):
         ''' Start our test thread '''
         temp_directory = os.path.join(self.settings['RemotePanel']['temp_folder'],'temp')
-        log_path = os.path.abspath(os.path.join(temp_directory, "output.csv"))
-        if os.path.exists(log_path):
-            os.remove(log_path)
-        log_path = os.path.abspath(os.path.join(temp_directory, "log_0.csv"))
-        if os.path.exists(log_path):
-            os.remove(log_path)
+        if self.graphing.signal_store is not None:
+            # Release any memory-mapped log from the last run before it is replaced
+            self.graphing.clearData()
+        for log_name in ("output.bin", "output.csv", "log_0.csv"):
+            log_path = os.path.abspath(os.path.join(temp_directory, log_name))
+            if os.path.exists(log_path):
+                os.remove(log_path)
         # Connect signals from the worker to slots in the main thread
         self.worker.progress_update.connect(self.progressBarCallback)
         self.worker.finished.connect(self.threadFinished)
@@ -160,12 +161,15 @@ class TestProgressWindow(QMainWindow):
         self.cancel_btn.setEnabled(False)
         if val == 0:
             temp_directory = os.path.join(self.settings['RemotePanel']['temp_folder'],'temp')
-            log_path = os.path.abspath(os.path.join(temp_directory, "log_0.csv"))
+            bin_path = os.path.abspath(os.path.join(temp_directory, "output.bin"))
+            csv_path = os.path.abspath(os.path.join(temp_directory, "log_0.csv"))
             cfg_path = os.path.abspath(os.path.join(temp_directory, "Simulation.cfg"))
-            if os.path.exists(log_path):
+            if os.path.exists(bin_path) or os.path.exists(csv_path):
                 try:
-                    csv_path = os.path.abspath(os.path.join(temp_directory, "log_0.csv"))
-                    self.graphing.loadCSVData(csv_path)
+                    if os.path.exists(bin_path):
+                        self.graphing.loadBinaryData(bin_path)
+                    else:
+                        self.graphing.loadCSVData(csv_path)
                 except DataException as e:
                     self.showErrorMessage(str(e))
             else: